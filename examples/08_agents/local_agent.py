@@ -11,9 +11,14 @@ import json
 import math
 import ast
 import operator
+import functools
+import selectors
 import subprocess
 import os
+import stat
+import time
 import argparse
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime
 
@@ -29,9 +34,23 @@ from utils.client import get_client, print_error
 
 console = Console()
 
+# Compact JSON encoding/decoding for tool calls — orjson (C) when available
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+    _loads = json.loads
+
 
 # =============================================================================
-# Safe Expression Evaluator (from multi_function_agent.py)
+# Safe Expression Evaluator (whitelist-validate, then compile to bytecode)
 # =============================================================================
 
 SAFE_OPERATORS = {
@@ -51,38 +70,87 @@ SAFE_FUNCTIONS = {
 
 SAFE_CONSTANTS = {"pi": math.pi, "e": math.e}
 
+# Namespace handed to eval() for validated expressions — built once.
+_SAFE_NS = {**SAFE_CONSTANTS, **SAFE_FUNCTIONS}
 
-def safe_eval_node(node):
-    """Recursively evaluate an AST node safely."""
-    if isinstance(node, ast.Constant):
-        if isinstance(node.value, (int, float)):
-            return node.value
-        raise ValueError(f"Unsupported constant type: {type(node.value)}")
+
+@functools.lru_cache(maxsize=256)
+def _parse_cached(expr: str) -> ast.Expression:
+    """Parse an expression once; repeated calculations reuse the cached AST."""
+    return ast.parse(expr, mode="eval")
+
+
+def _validate(node):
+    """Recursively check an AST node against the whitelist."""
+    if isinstance(node, ast.Expression):
+        _validate(node.body)
+    elif isinstance(node, ast.Constant):
+        if not isinstance(node.value, (int, float)):
+            raise ValueError(f"Unsupported constant type: {type(node.value)}")
     elif isinstance(node, ast.Name):
-        if node.id in SAFE_CONSTANTS:
-            return SAFE_CONSTANTS[node.id]
-        raise ValueError(f"Unknown variable: {node.id}")
+        if node.id not in SAFE_CONSTANTS:
+            raise ValueError(f"Unknown variable: {node.id}")
     elif isinstance(node, ast.BinOp):
-        op_type = type(node.op)
-        if op_type not in SAFE_OPERATORS:
-            raise ValueError(f"Unsupported operator: {op_type.__name__}")
-        return SAFE_OPERATORS[op_type](safe_eval_node(node.left), safe_eval_node(node.right))
+        if type(node.op) not in SAFE_OPERATORS:
+            raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+        _validate(node.left)
+        _validate(node.right)
     elif isinstance(node, ast.UnaryOp):
-        op_type = type(node.op)
-        if op_type not in SAFE_OPERATORS:
-            raise ValueError(f"Unsupported operator: {op_type.__name__}")
-        return SAFE_OPERATORS[op_type](safe_eval_node(node.operand))
+        if type(node.op) not in SAFE_OPERATORS:
+            raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+        _validate(node.operand)
     elif isinstance(node, ast.Call):
-        if isinstance(node.func, ast.Name) and node.func.id in SAFE_FUNCTIONS:
-            args = [safe_eval_node(arg) for arg in node.args]
-            return SAFE_FUNCTIONS[node.func.id](*args)
-        raise ValueError(f"Unsupported function: {getattr(node.func, 'id', type(node.func).__name__)}")
-    elif isinstance(node, ast.Expression):
-        return safe_eval_node(node.body)
+        if not (isinstance(node.func, ast.Name) and node.func.id in SAFE_FUNCTIONS):
+            raise ValueError(f"Unsupported function: {getattr(node.func, 'id', type(node.func).__name__)}")
+        if node.keywords:
+            raise ValueError("Keyword arguments are not supported")
+        for arg in node.args:
+            _validate(arg)
     else:
         raise ValueError(f"Unsupported expression type: {type(node).__name__}")
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_cached(expr: str):
+    """Parse, whitelist-validate, and compile an expression to a code object."""
+    tree = _parse_cached(expr)
+    _validate(tree)
+    return compile(tree, "<calc>", "eval")
+
+
+# After this many calls with the same expression, try to JIT it to native code
+_JIT_THRESHOLD = 5
+_call_counts: dict[str, int] = {}
+_jit_cache: dict[str, object] = {}
+
+
+def _maybe_jit(expression: str):
+    """Return a Numba-compiled function for a hot expression, or None.
+
+    Only reached after the expression passed whitelist validation, so
+    nothing untrusted hits exec(). If Numba is missing or compilation
+    fails, None is cached and callers stay on the bytecode path.
+    """
+    if expression in _jit_cache:
+        return _jit_cache[expression]
+    count = _call_counts.get(expression, 0) + 1
+    _call_counts[expression] = count
+    if count < _JIT_THRESHOLD:
+        return None
+    fn = None
+    try:
+        from numba import njit
+
+        namespace = dict(_SAFE_NS)
+        exec(f"def _f():\n    return {expression}\n", namespace)
+        fn = njit(cache=True)(namespace["_f"])
+        fn()  # force compilation now so failures fall back immediately
+    except Exception:
+        fn = None
+    _jit_cache[expression] = fn
+    return fn
+
+
 # =============================================================================
 # Tool Implementations (real, local)
 # =============================================================================
@@ -91,22 +159,57 @@ MAX_FILE_SIZE = 100 * 1024  # 100KB
 MAX_OUTPUT_SIZE = 10 * 1024  # 10KB
 COMMAND_TIMEOUT = 30  # seconds
 
+# The agent never chdir()s, so resolve the working directory once
+_CWD = os.getcwd()
+
+
+# Read-through cache for read_file, keyed on (path, mtime_ns, size) so a
+# changed file misses automatically. LRU-evicted beyond _READ_CACHE_MAX.
+_READ_CACHE_MAX = 32
+_read_cache: OrderedDict[tuple, dict] = OrderedDict()
+
+
+@functools.lru_cache(maxsize=512)
+def _resolve(path: str) -> Path:
+    """Resolve a user-supplied path once per session; resolve() is a full
+    realpath syscall chain and agent loops re-touch the same paths often."""
+    return Path(path).expanduser().resolve()
+
 
 def read_file(path: str) -> dict:
     """Read a file from the local filesystem."""
     try:
-        p = Path(path).expanduser().resolve()
-        if not p.exists():
+        p = _resolve(path)
+        try:
+            st = os.stat(p)
+        except FileNotFoundError:
             return {"error": f"File not found: {p}"}
-        if not p.is_file():
+        if not stat.S_ISREG(st.st_mode):
             return {"error": f"Not a file: {p}"}
-        if p.stat().st_size > MAX_FILE_SIZE:
-            return {"error": f"File too large ({p.stat().st_size} bytes, max {MAX_FILE_SIZE})"}
+        if st.st_size > MAX_FILE_SIZE:
+            return {"error": f"File too large ({st.st_size} bytes, max {MAX_FILE_SIZE})"}
+
+        key = (str(p), st.st_mtime_ns, st.st_size)
+        cached = _read_cache.get(key)
+        if cached is not None:
+            _read_cache.move_to_end(key)
+            return cached
+
+        fd = os.open(p, os.O_RDONLY)
         try:
-            content = p.read_text(encoding="utf-8")
+            data = os.read(fd, st.st_size)
+        finally:
+            os.close(fd)
+        try:
+            content = data.decode("utf-8")
         except UnicodeDecodeError:
             return {"error": f"Binary file, cannot read as text: {p}"}
-        return {"path": str(p), "content": content, "size": len(content)}
+
+        resp = {"path": str(p), "content": content, "size": len(content)}
+        _read_cache[key] = resp
+        if len(_read_cache) > _READ_CACHE_MAX:
+            _read_cache.popitem(last=False)
+        return resp
     except Exception as e:
         return {"error": str(e)}
 
@@ -114,7 +217,7 @@ def read_file(path: str) -> dict:
 def write_file(path: str, content: str) -> dict:
     """Write content to a file on the local filesystem."""
     try:
-        p = Path(path).expanduser().resolve()
+        p = _resolve(path)
         existed = p.exists()
         p.parent.mkdir(parents=True, exist_ok=True)
         p.write_text(content, encoding="utf-8")
@@ -126,17 +229,23 @@ def write_file(path: str, content: str) -> dict:
 def list_directory(path: str = ".") -> dict:
     """List contents of a directory with file sizes."""
     try:
-        p = Path(path).expanduser().resolve()
+        p = _resolve(path)
         if not p.exists():
             return {"error": f"Directory not found: {p}"}
         if not p.is_dir():
             return {"error": f"Not a directory: {p}"}
 
+        # scandir DirEntry objects cache type/size from the directory read,
+        # so this is one syscall per entry instead of three stats
+        with os.scandir(p) as it:
+            raw = sorted(it, key=lambda e: e.name)
+
         entries = []
-        for item in sorted(p.iterdir()):
-            entry = {"name": item.name, "type": "dir" if item.is_dir() else "file"}
-            if item.is_file():
-                entry["size"] = item.stat().st_size
+        for item in raw:
+            is_dir = item.is_dir(follow_symlinks=False)
+            entry = {"name": item.name, "type": "dir" if is_dir else "file"}
+            if not is_dir:
+                entry["size"] = item.stat(follow_symlinks=False).st_size
             entries.append(entry)
 
         return {"path": str(p), "count": len(entries), "entries": entries}
@@ -145,51 +254,113 @@ def list_directory(path: str = ".") -> dict:
 
 
 def run_command(command: str) -> dict:
-    """Run a shell command and return output."""
+    """Run a shell command and return output, capping captured output in memory.
+
+    Output beyond MAX_OUTPUT_SIZE per stream is read and discarded rather
+    than buffered, so a runaway command can't balloon the process RSS.
+    """
     try:
-        result = subprocess.run(
-            command, shell=True, capture_output=True, text=True,
-            timeout=COMMAND_TIMEOUT, cwd=os.getcwd(),
+        proc = subprocess.Popen(
+            command, shell=True,
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            cwd=_CWD,
         )
-        stdout = result.stdout[:MAX_OUTPUT_SIZE] if result.stdout else ""
-        stderr = result.stderr[:MAX_OUTPUT_SIZE] if result.stderr else ""
-        truncated = len(result.stdout or "") > MAX_OUTPUT_SIZE or len(result.stderr or "") > MAX_OUTPUT_SIZE
-        resp = {"command": command, "returncode": result.returncode, "stdout": stdout}
-        if stderr:
-            resp["stderr"] = stderr
-        if truncated:
-            resp["truncated"] = True
-        return resp
+    except Exception as e:
+        return {"error": str(e), "command": command}
+
+    truncated = False
+    deadline = time.monotonic() + COMMAND_TIMEOUT
+    sel = selectors.DefaultSelector()
+    sel.register(proc.stdout, selectors.EVENT_READ, bytearray())
+    sel.register(proc.stderr, selectors.EVENT_READ, bytearray())
+    out = sel.get_key(proc.stdout).data
+    err = sel.get_key(proc.stderr).data
+
+    try:
+        open_pipes = 2
+        while open_pipes:
+            remaining = deadline - time.monotonic()
+            events = sel.select(remaining) if remaining > 0 else []
+            if not events:
+                raise subprocess.TimeoutExpired(command, COMMAND_TIMEOUT)
+            for key, _ in events:
+                data = os.read(key.fd, 64 * 1024)
+                if not data:
+                    sel.unregister(key.fileobj)
+                    open_pipes -= 1
+                elif len(key.data) < MAX_OUTPUT_SIZE:
+                    room = MAX_OUTPUT_SIZE - len(key.data)
+                    if len(data) > room:
+                        truncated = True
+                    key.data.extend(data[:room])
+                else:
+                    truncated = True
+        returncode = proc.wait(timeout=max(deadline - time.monotonic(), 0))
     except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
         return {"error": f"Command timed out after {COMMAND_TIMEOUT}s", "command": command}
     except Exception as e:
+        proc.kill()
+        proc.wait()
         return {"error": str(e), "command": command}
+    finally:
+        sel.close()
+        proc.stdout.close()
+        proc.stderr.close()
+
+    resp = {
+        "command": command,
+        "returncode": returncode,
+        "stdout": out.decode(errors="replace"),
+    }
+    stderr = err.decode(errors="replace")
+    if stderr:
+        resp["stderr"] = stderr
+    if truncated:
+        resp["truncated"] = True
+    return resp
 
 
 def calculate(expression: str) -> dict:
-    """Evaluate a mathematical expression safely using AST parsing."""
+    """Evaluate a mathematical expression safely via validated bytecode."""
     try:
-        tree = ast.parse(expression, mode="eval")
-        result = safe_eval_node(tree)
-        return {"expression": expression, "result": result}
+        code = _compile_cached(expression)
     except SyntaxError as e:
         return {"error": f"Invalid syntax: {e}"}
+    except ValueError as e:
+        return {"error": str(e)}
+    fn = _maybe_jit(expression)
+    try:
+        if fn is not None:
+            result = fn()
+        else:
+            result = eval(code, {"__builtins__": {}}, _SAFE_NS)
+        return {"expression": expression, "result": result}
     except ZeroDivisionError:
         return {"error": "Division by zero"}
     except Exception as e:
         return {"error": str(e)}
 
 
+# Resolved once — astimezone() re-reads the system timezone on every call
+_LOCAL_TZ = datetime.now().astimezone().tzinfo
+_LOCAL_TZ_STR = str(_LOCAL_TZ)
+
+_DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+
 def get_datetime() -> dict:
     """Get current date, time, and related info."""
-    now = datetime.now()
+    now = datetime.now(_LOCAL_TZ)
+    iso = now.isoformat()
     return {
-        "datetime": now.isoformat(),
-        "date": now.strftime("%Y-%m-%d"),
-        "time": now.strftime("%H:%M:%S"),
-        "day_of_week": now.strftime("%A"),
+        "datetime": iso,
+        "date": iso[:10],          # YYYY-MM-DD
+        "time": iso[11:19],        # HH:MM:SS
+        "day_of_week": _DAY_NAMES[now.weekday()],
         "week_number": now.isocalendar()[1],
-        "timezone": str(now.astimezone().tzinfo),
+        "timezone": _LOCAL_TZ_STR,
     }
 
 
@@ -197,7 +368,9 @@ def get_datetime() -> dict:
 # Tool Definitions (JSON schemas for API)
 # =============================================================================
 
-TOOLS = [
+# Static for the life of the process — a tuple so nothing rebuilds or mutates
+# it per turn and the client can cache its encoded form by identity.
+TOOLS = (
     {
         "type": "function",
         "function": {
@@ -276,7 +449,7 @@ TOOLS = [
             "parameters": {"type": "object", "properties": {}},
         },
     },
-]
+)
 
 FUNCTION_MAP = {
     "read_file": read_file,
@@ -294,16 +467,34 @@ SYSTEM_PROMPT = (
     "Be concise. When showing file contents, summarize unless the user asks for the full output."
 )
 
+# Canonical seed message — copy()'d wherever a fresh conversation starts so the
+# prompt text stays a single source of truth
+_SEED_MSG = {"role": "system", "content": SYSTEM_PROMPT}
+
 
 # =============================================================================
 # Streaming Agent Loop
 # =============================================================================
 
-def stream_agent_turn(client, messages, show_thinking: bool = True) -> str | None:
+# Batched stdout flushing: group streamed tokens so the terminal still feels
+# live without paying a write+flush syscall per token.
+_FLUSH_BATCH = 8        # tokens
+_FLUSH_INTERVAL = 0.05  # seconds
+
+# Result previews are cosmetic; skip them when output is piped
+_STDOUT_ISATTY = sys.stdout.isatty()
+
+def stream_agent_turn(
+    client, messages, show_thinking: bool = True, stop_on_content: bool = True
+) -> str | None:
     """
     Send messages to GLM-5 with streaming, process response in real-time.
-    Returns the final content, or None if only tool calls were made.
+    Returns the final content, or None if another iteration is needed.
     Appends assistant and tool messages to the messages list in-place.
+
+    With stop_on_content, content streamed alongside tool calls counts as
+    the final answer (tool results are still appended to the history),
+    saving the follow-up round-trip.
     """
     response = client.create_chat(
         messages=messages,
@@ -314,12 +505,38 @@ def stream_agent_turn(client, messages, show_thinking: bool = True) -> str | Non
         temperature=Defaults.TEMPERATURE,
     )
 
-    reasoning = ""
-    content = ""
-    tool_calls = {}  # {index: {id, function: {name, arguments}}}
+    # Fragments are collected in lists and joined once after the stream —
+    # str += per delta is O(n^2) over a long response
+    reasoning_parts: list[str] = []
+    content_parts: list[str] = []
+    tool_calls: list[dict] = []  # API-shaped, in arrival order; arguments as fragment lists
+    tool_call_pos: dict[int, int] = {}  # stream index -> position in tool_calls
     reasoning_started = False
     content_started = False
 
+    # Local references — avoids global/attribute lookups in the per-chunk loop
+    _cprint = console.print
+
+    pending: list[str] = []
+    last_flush = time.monotonic()
+
+    def _emit(text: str):
+        """Buffer a token, flushing every _FLUSH_BATCH tokens or _FLUSH_INTERVAL s."""
+        nonlocal last_flush
+        pending.append(text)
+        now = time.monotonic()
+        if len(pending) >= _FLUSH_BATCH or now - last_flush > _FLUSH_INTERVAL:
+            sys.stdout.write("".join(pending))
+            sys.stdout.flush()
+            pending.clear()
+            last_flush = now
+
+    def _drain():
+        if pending:
+            sys.stdout.write("".join(pending))
+            sys.stdout.flush()
+            pending.clear()
+
     for chunk in response:
         if not chunk.choices or not chunk.choices[0].delta:
             continue
@@ -327,40 +544,51 @@ def stream_agent_turn(client, messages, show_thinking: bool = True) -> str | Non
         delta = chunk.choices[0].delta
 
         # Stream reasoning content
-        if hasattr(delta, "reasoning_content") and delta.reasoning_content:
-            reasoning += delta.reasoning_content
+        reasoning_delta = getattr(delta, "reasoning_content", None)
+        if reasoning_delta:
+            reasoning_parts.append(reasoning_delta)
             if show_thinking:
                 if not reasoning_started:
-                    console.print("[dim italic]Thinking...[/dim italic]", end="")
+                    _cprint("[dim italic]Thinking...[/dim italic]", end="")
                     reasoning_started = True
-                print(delta.reasoning_content, end="", flush=True)
+                _emit(reasoning_delta)
 
         # Stream regular content
-        if hasattr(delta, "content") and delta.content:
+        content_delta = getattr(delta, "content", None)
+        if content_delta:
             if not content_started:
                 if reasoning_started and show_thinking:
-                    print("\n")  # newline after reasoning
+                    _emit("\n\n")  # newline after reasoning
                 content_started = True
-            content += delta.content
-            print(delta.content, end="", flush=True)
+            content_parts.append(content_delta)
+            _emit(content_delta)
 
         # Accumulate tool calls (concatenate arguments by index)
-        if hasattr(delta, "tool_calls") and delta.tool_calls:
-            for tc in delta.tool_calls:
-                idx = tc.index
-                if idx not in tool_calls:
-                    tool_calls[idx] = {
+        tool_call_deltas = getattr(delta, "tool_calls", None)
+        if tool_call_deltas:
+            for tc in tool_call_deltas:
+                pos = tool_call_pos.get(tc.index)
+                if pos is None:
+                    tool_call_pos[tc.index] = len(tool_calls)
+                    tool_calls.append({
                         "id": tc.id,
+                        "type": "function",
                         "function": {
                             "name": tc.function.name or "",
-                            "arguments": tc.function.arguments or "",
+                            "arguments": [tc.function.arguments or ""],
                         },
-                    }
-                else:
-                    if tc.function.arguments:
-                        tool_calls[idx]["function"]["arguments"] += tc.function.arguments
+                    })
+                elif tc.function.arguments:
+                    tool_calls[pos]["function"]["arguments"].append(tc.function.arguments)
+
+    # Join accumulated fragments once now that the stream is done
+    reasoning = "".join(reasoning_parts)
+    content = "".join(content_parts)
+    for tc in tool_calls:
+        tc["function"]["arguments"] = "".join(tc["function"]["arguments"])
 
     # End streaming output
+    _drain()
     if reasoning_started and show_thinking and not content_started and not tool_calls:
         print()  # newline after reasoning if no content followed
     if content_started:
@@ -373,14 +601,8 @@ def stream_agent_turn(client, messages, show_thinking: bool = True) -> str | Non
     if reasoning:
         assistant_msg["reasoning_content"] = reasoning
     if tool_calls:
-        assistant_msg["tool_calls"] = [
-            {
-                "id": tc["id"],
-                "type": "function",
-                "function": tc["function"],
-            }
-            for tc in tool_calls.values()
-        ]
+        # Already API-shaped and in arrival order (indices stream monotonically)
+        assistant_msg["tool_calls"] = tool_calls
         if "content" not in assistant_msg:
             assistant_msg["content"] = None
 
@@ -388,21 +610,20 @@ def stream_agent_turn(client, messages, show_thinking: bool = True) -> str | Non
 
     # Execute tool calls if any
     if tool_calls:
-        for idx in sorted(tool_calls.keys()):
-            tc = tool_calls[idx]
+        for tc in tool_calls:
             func_name = tc["function"]["name"]
             raw_args = tc["function"]["arguments"]
 
             console.print(f"\n[cyan]> {func_name}[/cyan]", end="")
 
             try:
-                func_args = json.loads(raw_args) if raw_args.strip() else {}
+                func_args = _loads(raw_args) if raw_args else {}
             except json.JSONDecodeError as e:
                 console.print(f"  [red]JSON parse error: {e}[/red]")
                 messages.append({
                     "role": "tool",
                     "tool_call_id": tc["id"],
-                    "content": json.dumps({"error": f"Invalid arguments JSON: {e}"}),
+                    "content": _dumps({"error": f"Invalid arguments JSON: {e}"}),
                 })
                 continue
 
@@ -418,13 +639,13 @@ def stream_agent_turn(client, messages, show_thinking: bool = True) -> str | Non
             else:
                 result = {"error": f"Unknown function: {func_name}"}
 
-            result_str = json.dumps(result)
+            result_str = _dumps(result)
 
             # Show result preview
             if "error" in result:
                 console.print(f"  [red]{result['error']}[/red]")
-            else:
-                preview = result_str[:200] + "..." if len(result_str) > 200 else result_str
+            elif _STDOUT_ISATTY:
+                preview = f"{result_str[:200]}..." if len(result_str) > 200 else result_str
                 console.print(f"  [dim]{preview}[/dim]")
 
             messages.append({
@@ -433,15 +654,18 @@ def stream_agent_turn(client, messages, show_thinking: bool = True) -> str | Non
                 "content": result_str,
             })
 
+        if content and stop_on_content:
+            return content  # model already gave its answer; skip the extra round-trip
         return None  # signal: tool calls were made, need another iteration
 
     return content  # final answer
 
 
-def agent_turn(client, messages, show_thinking: bool = True, max_iterations: int = 10):
+def agent_turn(client, messages, show_thinking: bool = True, max_iterations: int = 10,
+               stop_on_content: bool = True):
     """Run the agent loop for one user turn. Loops until a final answer or max iterations."""
     for i in range(max_iterations):
-        result = stream_agent_turn(client, messages, show_thinking)
+        result = stream_agent_turn(client, messages, show_thinking, stop_on_content)
         if result is not None:
             return result  # final answer produced
     console.print("[yellow]Reached max iterations for this turn.[/yellow]")
@@ -467,7 +691,7 @@ def repl(show_thinking: bool = True):
         print_error(e, "Failed to initialize client")
         return
 
-    messages = [{"role": "system", "content": SYSTEM_PROMPT}]
+    messages = [_SEED_MSG.copy()]
 
     while True:
         try:
@@ -482,7 +706,7 @@ def repl(show_thinking: bool = True):
             console.print("[dim]Goodbye.[/dim]")
             break
         if user_input.lower() == "clear":
-            messages = [{"role": "system", "content": SYSTEM_PROMPT}]
+            messages = [_SEED_MSG.copy()]
             console.print("[dim]History cleared.[/dim]")
             continue
 
@@ -506,7 +730,7 @@ def single_query(query: str, show_thinking: bool = True):
         return
 
     messages = [
-        {"role": "system", "content": SYSTEM_PROMPT},
+        _SEED_MSG.copy(),
         {"role": "user", "content": query},
     ]
 
@@ -542,7 +766,7 @@ def demo(show_thinking: bool = True):
         console.print(f"[bold]Demo {i}/{len(queries)}:[/bold] {query}\n")
 
         messages = [
-            {"role": "system", "content": SYSTEM_PROMPT},
+            _SEED_MSG.copy(),
             {"role": "user", "content": query},
         ]
 
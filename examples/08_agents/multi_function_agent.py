@@ -12,6 +12,7 @@ import json
 import math
 import ast
 import operator
+import functools
 from pathlib import Path
 from datetime import datetime
 
@@ -59,43 +60,74 @@ SAFE_CONSTANTS = {
 }
 
 
+def _resolve(tree):
+    """Attach resolved operator/function callables to nodes, validating as we go."""
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.BinOp, ast.UnaryOp)):
+            op_type = type(node.op)
+            if op_type not in SAFE_OPERATORS:
+                raise ValueError(f"Unsupported operator: {op_type.__name__}")
+            node._op = SAFE_OPERATORS[op_type]
+        elif isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name):
+                raise ValueError(f"Unsupported call type: {type(node.func).__name__}")
+            if node.func.id not in SAFE_FUNCTIONS:
+                raise ValueError(f"Unsupported function: {node.func.id}")
+            node._func = SAFE_FUNCTIONS[node.func.id]
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_cached(expr: str) -> ast.Expression:
+    """Parse an expression once and pre-resolve its operator/function lookups."""
+    tree = ast.parse(expr, mode="eval")
+    _resolve(tree)
+    return tree
+
+
+def _eval_constant(node):
+    if isinstance(node.value, (int, float)):
+        return node.value
+    raise ValueError(f"Unsupported constant type: {type(node.value)}")
+
+
+def _eval_name(node):
+    # Handle named constants like pi, e
+    if node.id in SAFE_CONSTANTS:
+        return SAFE_CONSTANTS[node.id]
+    raise ValueError(f"Unknown variable: {node.id}")
+
+
+def _eval_binop(node):
+    # _op was resolved by _resolve() at parse time
+    return node._op(safe_eval_node(node.left), safe_eval_node(node.right))
+
+
+def _eval_unaryop(node):
+    return node._op(safe_eval_node(node.operand))
+
+
+def _eval_call(node):
+    # Handle function calls like sqrt(16), sin(0.5); _func resolved at parse time
+    return node._func(*[safe_eval_node(arg) for arg in node.args])
+
+
+# Single type() lookup instead of a chain of isinstance checks per node
+_DISPATCH = {
+    ast.Constant: _eval_constant,
+    ast.Name: _eval_name,
+    ast.BinOp: _eval_binop,
+    ast.UnaryOp: _eval_unaryop,
+    ast.Call: _eval_call,
+    ast.Expression: lambda node: safe_eval_node(node.body),
+}
+
+
 def safe_eval_node(node):
-    """Recursively evaluate an AST node safely."""
-    if isinstance(node, ast.Constant):
-        if isinstance(node.value, (int, float)):
-            return node.value
-        raise ValueError(f"Unsupported constant type: {type(node.value)}")
-    elif isinstance(node, ast.Name):
-        # Handle named constants like pi, e
-        if node.id in SAFE_CONSTANTS:
-            return SAFE_CONSTANTS[node.id]
-        raise ValueError(f"Unknown variable: {node.id}")
-    elif isinstance(node, ast.BinOp):
-        op_type = type(node.op)
-        if op_type not in SAFE_OPERATORS:
-            raise ValueError(f"Unsupported operator: {op_type.__name__}")
-        left = safe_eval_node(node.left)
-        right = safe_eval_node(node.right)
-        return SAFE_OPERATORS[op_type](left, right)
-    elif isinstance(node, ast.UnaryOp):
-        op_type = type(node.op)
-        if op_type not in SAFE_OPERATORS:
-            raise ValueError(f"Unsupported operator: {op_type.__name__}")
-        operand = safe_eval_node(node.operand)
-        return SAFE_OPERATORS[op_type](operand)
-    elif isinstance(node, ast.Call):
-        # Handle function calls like sqrt(16), sin(0.5)
-        if isinstance(node.func, ast.Name):
-            func_name = node.func.id
-            if func_name not in SAFE_FUNCTIONS:
-                raise ValueError(f"Unsupported function: {func_name}")
-            args = [safe_eval_node(arg) for arg in node.args]
-            return SAFE_FUNCTIONS[func_name](*args)
-        raise ValueError(f"Unsupported call type: {type(node.func).__name__}")
-    elif isinstance(node, ast.Expression):
-        return safe_eval_node(node.body)
-    else:
+    """Evaluate an AST node safely via the dispatch table."""
+    handler = _DISPATCH.get(type(node))
+    if handler is None:
         raise ValueError(f"Unsupported expression type: {type(node).__name__}")
+    return handler(node)
 
 
 # =============================================================================
@@ -105,13 +137,16 @@ def safe_eval_node(node):
 def calculate(expression: str) -> dict:
     """Evaluate mathematical expressions safely using AST parsing."""
     try:
-        tree = ast.parse(expression, mode='eval')
-        result = safe_eval_node(tree)
-        return {"expression": expression, "result": result}
+        tree = _parse_cached(expression)
     except SyntaxError as e:
         return {"error": f"Invalid expression syntax: {e}"}
     except ValueError as e:
         return {"error": str(e)}
+    try:
+        result = safe_eval_node(tree)
+        return {"expression": expression, "result": result}
+    except ValueError as e:
+        return {"error": str(e)}
     except ZeroDivisionError:
         return {"error": "Division by zero"}
     except Exception as e: